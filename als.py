@@ -0,0 +1,243 @@
+# als.py - Implicit-feedback matrix factorization (ALS) with versioned on-disk artifacts
+
+import json
+import os
+import time
+import zipfile
+import numpy as np
+from scipy import sparse
+
+MODEL_FILE = 'model.npz'
+METADATA_FILE = 'metadata.json'
+
+
+# Upper bound on the gathered per-enrollment factor rows held at once while solving (bytes)
+SOLVE_BLOCK_BYTES = 64 * 1024 * 1024
+# Conjugate-gradient steps per row and half-step (factors are warm-started between iterations)
+CG_STEPS = 3
+
+
+def _solve_rows(matrix, fixed, regularization, alpha, initial=None, cg_steps=CG_STEPS):
+    """
+    One ALS half-step (Hu, Koren & Volinsky 2008): solves every row of `matrix`
+    against the fixed factors. Confidence is 1 + alpha * weight, preference is 1
+    wherever a weight is stored. Rows without entries get zero factors.
+
+    Each row's k x k system is solved approximately by conjugate gradient,
+    warm-started from `initial` (Takacs et al. 2011). All rows of a block are
+    stepped together with sparse x dense products, so the cost is O(nnz * k) per
+    step, with no per-row Python loop and no k x k matrix per row. The dense
+    products run in BLAS, but they are small, so expect little multi-threading.
+    """
+    num_rows, num_factors = matrix.shape[0], fixed.shape[1]
+    gram = fixed.T @ fixed + regularization * np.eye(num_factors)
+    solved = np.zeros((num_rows, num_factors)) if initial is None else np.array(initial, dtype=np.float64)
+
+    counts = np.diff(matrix.indptr)
+    solved[counts == 0] = 0.0
+    rows = np.flatnonzero(counts)
+    if rows.size == 0:
+        return solved
+    cumulative = np.cumsum(counts[rows])
+    block_entries = max(1, SOLVE_BLOCK_BYTES // (num_factors * 8))
+
+    first = 0
+    while first < rows.size:
+        done = cumulative[first - 1] if first else 0
+        # Every block takes at least one row, even one with more entries than the budget
+        last = max(first + 1, int(np.searchsorted(cumulative, done + block_entries, side='right')))
+        block = rows[first:last]
+
+        lo, hi = matrix.indptr[block[0]], matrix.indptr[block[-1] + 1]
+        indices = matrix.indices[lo:hi]
+        indptr = np.append(matrix.indptr[block] - lo, hi - lo)
+        factors = fixed[indices]
+        extra_confidence = alpha * matrix.data[lo:hi]
+        entry_rows = np.repeat(np.arange(block.size), counts[block])
+
+        def block_matrix(data):
+            return sparse.csr_matrix((data, indices, indptr), shape=(block.size, fixed.shape[0]))
+
+        def apply_a(x):
+            # A_u x_u = (Y'Y + lambda*I) x_u + sum_j alpha * w_uj * (y_j . x_u) * y_j
+            dots = np.einsum('ek,ek->e', factors, x[entry_rows]) * extra_confidence
+            return x @ gram + block_matrix(dots) @ fixed
+
+        # b_u = sum_j (1 + alpha * w_uj) * y_j
+        b = block_matrix(1.0 + extra_confidence) @ fixed
+        x = solved[block]
+        residual = b - apply_a(x)
+        direction = residual.copy()
+        residual_sq = np.einsum('ij,ij->i', residual, residual)
+        for _ in range(cg_steps):
+            a_direction = apply_a(direction)
+            curvature = np.einsum('ij,ij->i', direction, a_direction)
+            step = np.divide(residual_sq, curvature, out=np.zeros_like(residual_sq), where=curvature > 0)
+            x = x + step[:, None] * direction
+            residual = residual - step[:, None] * a_direction
+            new_residual_sq = np.einsum('ij,ij->i', residual, residual)
+            ratio = np.divide(new_residual_sq, residual_sq, out=np.zeros_like(residual_sq), where=residual_sq > 0)
+            direction = residual + ratio[:, None] * direction
+            residual_sq = new_residual_sq
+        solved[block] = x
+
+        first = last
+    return solved
+
+
+class ALSModel:
+    """Low-rank course factors trained on the enrollment matrix; virtual users are folded in per request."""
+
+    def __init__(self, course_ids, item_factors, regularization, alpha, metadata=None):
+        # course_ids are sorted and aligned with item_factors rows
+        self.course_ids = np.asarray(course_ids, dtype=np.int64)
+        self.item_factors = np.ascontiguousarray(item_factors, dtype=np.float64)
+        self.regularization = regularization
+        self.alpha = alpha
+        self.metadata = metadata or {}
+        self.gram = self.item_factors.T @ self.item_factors + regularization * np.eye(self.item_factors.shape[1])
+
+    @property
+    def version(self):
+        return self.metadata.get('version')
+
+    # --- Training ---
+
+    @classmethod
+    def train(cls, matrix, course_ids, factors=32, regularization=0.1, alpha=15.0, iterations=15, seed=0,
+              cg_steps=CG_STEPS, weighting=None):
+        """
+        Fits user and course factors to a user x course weight matrix (CSR, columns = course_ids).
+        weighting names the preset that built the matrix; it is stored in the metadata.
+        """
+        user_items = matrix.tocsr()
+        item_users = matrix.T.tocsr()
+
+        rng = np.random.default_rng(seed)
+        item_factors = rng.normal(scale=0.01, size=(matrix.shape[1], factors))
+        user_factors = None
+        for _ in range(iterations):
+            user_factors = _solve_rows(user_items, item_factors, regularization, alpha, user_factors, cg_steps)
+            item_factors = _solve_rows(item_users, user_factors, regularization, alpha, item_factors, cg_steps)
+
+        metadata = {
+            'weighting': weighting,
+            'factors': factors,
+            'iterations': iterations,
+            'cg_steps': cg_steps,
+            'num_users': int(matrix.shape[0]),
+            'num_courses': int(matrix.shape[1]),
+            'num_enrollments': int(matrix.nnz),
+            'seed': seed,
+        }
+        return cls(course_ids, item_factors, regularization, alpha, metadata)
+
+    # --- Scoring ---
+
+    def recommend(self, taken_course_ids, num_recommendations=4, num_explanations=3):
+        """
+        Folds the taken courses in as a new user with one small least-squares solve,
+        scores every course with one mat-vec, and returns the top courses with the
+        taken courses that contribute most to each score.
+        """
+        taken_ids = np.unique(np.asarray(list(taken_course_ids), dtype=np.int64))
+        if len(self.course_ids) == 0:
+            return []
+        rows = np.minimum(np.searchsorted(self.course_ids, taken_ids), len(self.course_ids) - 1)
+        taken_rows = rows[self.course_ids[rows] == taken_ids]
+        if taken_rows.size == 0:
+            return []
+
+        # 1. Fold in: (Y'Y + lambda*I + alpha * Yt'Yt) x = (1 + alpha) * Yt' 1
+        taken_factors = self.item_factors[taken_rows]
+        a = self.gram + self.alpha * (taken_factors.T @ taken_factors)
+        per_course = np.linalg.solve(a, taken_factors.T) * (1.0 + self.alpha)
+        user_vector = per_course.sum(axis=1)
+
+        # 2. Score every course with a single mat-vec
+        scores = self.item_factors @ user_vector
+        scores[taken_rows] = -np.inf
+
+        count = min(num_recommendations, len(scores) - taken_rows.size)
+        if count <= 0:
+            return []
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.lexsort((top, -scores[top]))]
+        top = top[scores[top] > 0]
+
+        # 3. Contribution of each taken course to each recommended score
+        contributions = self.item_factors[top] @ per_course
+
+        recommendations = []
+        for position, row in enumerate(top):
+            strongest = np.argsort(-contributions[position], kind='stable')[:num_explanations]
+            recommendations.append({
+                'id': int(self.course_ids[row]),
+                'score': float(scores[row]),
+                'explanation': {
+                    'model': 'als',
+                    'model_version': self.version,
+                    'contributing_course_ids': [int(self.course_ids[taken_rows[i]]) for i in strongest]
+                }
+            })
+        return recommendations
+
+    # --- Persistence ---
+
+    def save(self, model_dir):
+        """Writes the model to a new timestamped version directory and returns the version."""
+        version = time.strftime('%Y%m%dT%H%M%S')
+        suffix = 1
+        while os.path.exists(os.path.join(model_dir, version)):
+            version = f"{time.strftime('%Y%m%dT%H%M%S')}-{suffix}"
+            suffix += 1
+
+        path = os.path.join(model_dir, version)
+        os.makedirs(path)
+        np.savez(os.path.join(path, MODEL_FILE), course_ids=self.course_ids, item_factors=self.item_factors)
+
+        self.metadata.update({
+            'version': version,
+            'trained_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'regularization': self.regularization,
+            'alpha': self.alpha,
+        })
+        with open(os.path.join(path, METADATA_FILE), 'w') as f:
+            json.dump(self.metadata, f, indent=2)
+        return version
+
+    @classmethod
+    def load(cls, model_dir, version=None):
+        """
+        Loads a saved version (the newest one when version is None). Raises
+        FileNotFoundError when the version doesn't exist and ValueError when its
+        files are incomplete or corrupt.
+        """
+        if version is None:
+            versions = list_versions(model_dir)
+            if not versions:
+                raise FileNotFoundError(f"No ALS models found in {model_dir}. Run train_als.py first.")
+            version = versions[-1]
+        # Versions come from requests, so they must name a directory directly inside model_dir
+        elif (os.path.basename(version) != version or version in ('', '.', '..')
+              or not os.path.isfile(os.path.join(model_dir, version, METADATA_FILE))):
+            raise FileNotFoundError(f"ALS model version '{version}' not found in {model_dir}.")
+
+        path = os.path.join(model_dir, version)
+        try:
+            with open(os.path.join(path, METADATA_FILE)) as f:
+                metadata = json.load(f)
+            with np.load(os.path.join(path, MODEL_FILE)) as arrays:
+                return cls(arrays['course_ids'], arrays['item_factors'],
+                           metadata['regularization'], metadata['alpha'], metadata)
+        except (KeyError, TypeError, ValueError, OSError, EOFError, zipfile.BadZipFile) as e:
+            raise ValueError(f"ALS model version '{version}' in {model_dir} is incomplete or corrupt: {e!r}") from e
+
+def list_versions(model_dir):
+    """Saved model versions, oldest first (version names sort chronologically)."""
+    if not os.path.isdir(model_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(model_dir)
+        if os.path.isfile(os.path.join(model_dir, name, METADATA_FILE))
+    )
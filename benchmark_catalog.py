@@ -0,0 +1,77 @@
+# benchmark_catalog.py - Compares the in-memory CatalogStore with the ORM path used before it
+
+import time
+import tracemalloc
+from app import db, app, Course
+from catalog import CatalogStore
+
+NUM_REPEATS = 20
+
+
+def measure(build):
+    """
+    Returns (object, bytes retained by it, seconds per build). A warm-up call runs
+    first so one-time SQLAlchemy compile/cache/mapper allocations aren't counted,
+    and both paths are measured the same way (tracemalloc).
+    """
+    build()
+
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(NUM_REPEATS):
+        build()
+    elapsed = (time.perf_counter() - start) / NUM_REPEATS
+    return result, retained, elapsed
+
+
+def orm_course_list():
+    """What /api/courses used to do on every request: ORM instances + per-row dicts."""
+    db.session.expunge_all()
+    courses = db.session.execute(db.select(Course)).scalars().all()
+    return courses, [{
+        'id': course.id,
+        'title': course.title,
+        'department': course.department,
+        'description': course.description,
+        'credits': course.credits
+    } for course in courses]
+
+
+def catalog_store():
+    rows = db.session.query(
+        Course.id, Course.title, Course.department, Course.description, Course.credits
+    ).all()
+    return CatalogStore([tuple(r) for r in rows])
+
+
+def run_benchmark():
+    with app.app_context():
+        _, orm_bytes, orm_seconds = measure(orm_course_list)
+        catalog, catalog_bytes, catalog_seconds = measure(catalog_store)
+
+        # Per-request cost once the catalog is loaded (to_dicts is what a cold
+        # /api/courses pays; later requests reuse the encoded JSON body)
+        start = time.perf_counter()
+        for _ in range(NUM_REPEATS):
+            catalog.to_dicts()
+        to_dicts_seconds = (time.perf_counter() - start) / NUM_REPEATS
+
+        usage = catalog.memory_usage()
+        print(f"Courses: {len(catalog)} in {len(catalog.departments)} departments")
+        print("Retained memory (tracemalloc, after warm-up):")
+        print(f"  ORM instances + dicts : {orm_bytes / 1024:10.1f} KiB  {orm_seconds * 1000:8.2f} ms/request")
+        print(f"  CatalogStore          : {catalog_bytes / 1024:10.1f} KiB  {catalog_seconds * 1000:8.2f} ms/load (once)")
+        print(f"  Ratio (ORM / store)   : {orm_bytes / catalog_bytes:.1f}x")
+        print(f"CatalogStore.to_dicts   :             {to_dicts_seconds * 1000:8.2f} ms")
+        print(f"CatalogStore.memory_usage() (payload only): {usage['total'] / 1024:.1f} KiB")
+        for component, size in usage.items():
+            if component != 'total':
+                print(f"  {component:18s} {size / 1024:10.1f} KiB")
+
+
+if __name__ == '__main__':
+    run_benchmark()
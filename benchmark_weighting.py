@@ -0,0 +1,90 @@
+# benchmark_weighting.py - Compares binary vs grade/recency/IDF weighting on held-out enrollments
+
+import time
+from random import Random
+from app import db, app, Course, Enrollment
+from catalog import CatalogStore
+from recommender import RecommenderSnapshot
+from weighting import WEIGHTING_PRESETS
+
+NUM_RECOMMENDATIONS = 4
+# Each evaluated student keeps at least this many courses as input
+MIN_INPUT_COURSES = 2
+HOLDOUT_PER_USER = 2
+# Results are averaged over several random holdout splits
+SEEDS = (1, 2, 3, 4, 5)
+
+
+def load_enrollments():
+    rows = db.session.query(
+        Enrollment.user_id, Enrollment.course_id, Enrollment.grade, Enrollment.semester
+    ).all()
+    course_rows = db.session.query(
+        Course.id, Course.title, Course.department, Course.description, Course.credits
+    ).all()
+    return [tuple(r) for r in rows], CatalogStore([tuple(r) for r in course_rows])
+
+
+def split_holdout(enrollments, rng):
+    """Hides HOLDOUT_PER_USER random courses from every student with enough history."""
+    by_user = {}
+    for row in enrollments:
+        by_user.setdefault(row[0], []).append(row)
+
+    train, test = [], {}
+    for user_id, rows in by_user.items():
+        course_ids = sorted({r[1] for r in rows})
+        if len(course_ids) < MIN_INPUT_COURSES + HOLDOUT_PER_USER:
+            train.extend(rows)
+            continue
+        hidden = set(rng.sample(course_ids, HOLDOUT_PER_USER))
+        train.extend(r for r in rows if r[1] not in hidden)
+        test[user_id] = ([c for c in course_ids if c not in hidden], hidden)
+    return train, test
+
+
+def evaluate(weighting, train, catalog, test):
+    """Returns (precision@N, build seconds, per-request latencies) for one holdout split."""
+    start = time.perf_counter()
+    snapshot = RecommenderSnapshot(
+        [(r[0], r[1]) for r in train],
+        catalog,
+        grades=[r[2] for r in train],
+        semesters=[r[3] for r in train],
+        weighting=weighting
+    )
+    build_seconds = time.perf_counter() - start
+
+    hits, latencies = 0, []
+    for taken, hidden in test.values():
+        start = time.perf_counter()
+        recommendations = snapshot.recommend(taken, NUM_RECOMMENDATIONS)
+        latencies.append(time.perf_counter() - start)
+        hits += sum(1 for rec in recommendations if rec['id'] in hidden)
+
+    precision = hits / (NUM_RECOMMENDATIONS * len(test)) if test else 0.0
+    return precision, build_seconds, latencies
+
+
+def run_benchmark():
+    with app.app_context():
+        enrollments, catalog = load_enrollments()
+
+    splits = [split_holdout(enrollments, Random(seed)) for seed in SEEDS]
+    print(f"{len(enrollments)} enrollments, {len(splits[0][1])} students evaluated per split "
+          f"({HOLDOUT_PER_USER} held-out courses each, {len(SEEDS)} splits)")
+
+    for name, weighting in WEIGHTING_PRESETS.items():
+        results = [evaluate(weighting, train, catalog, test) for train, test in splits]
+        precision = sum(r[0] for r in results) / len(results)
+        build_ms = sum(r[1] for r in results) / len(results) * 1000
+        latencies = sorted(t for r in results for t in r[2])
+        mean_ms = sum(latencies) / len(latencies) * 1000 if latencies else 0.0
+        p95_ms = latencies[int(0.95 * (len(latencies) - 1))] * 1000 if latencies else 0.0
+        print(f"{name:10s} precision@{NUM_RECOMMENDATIONS}: {precision:.4f}   "
+              f"build: {build_ms:8.2f} ms   "
+              f"recommend mean/p95: {mean_ms:.3f} / {p95_ms:.3f} ms")
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,153 @@
+# catalog.py - Read-optimized, struct-of-arrays course catalog kept in memory
+
+import sys
+import numpy as np
+
+# Sentinel stored in the credits array when the column is NULL
+MISSING_CREDITS = -1
+
+
+class CatalogStore:
+    """
+    Compact, read-only copy of the course table.
+
+    Rows are sorted by course id. Numeric columns live in typed NumPy arrays,
+    departments are interned to small integer codes, and titles/descriptions are
+    packed into one UTF-8 buffer addressed by offset arrays.
+    """
+
+    def __init__(self, course_rows):
+        # course_rows: iterable of (id, title, department, description, credits)
+        rows = sorted(course_rows, key=lambda r: r[0])
+        n = len(rows)
+
+        self.ids = np.fromiter((r[0] for r in rows), dtype=np.int32, count=n)
+        self.credits = np.fromiter(
+            (MISSING_CREDITS if r[4] is None else r[4] for r in rows), dtype=np.int16, count=n
+        )
+
+        # 1. Intern department strings to small integer codes
+        self.departments = sorted({r[2] for r in rows})
+        dept_code = {dept: code for code, dept in enumerate(self.departments)}
+        self.dept_codes = np.fromiter((dept_code[r[2]] for r in rows), dtype=np.uint16, count=n)
+
+        # 2. Pack titles and descriptions into a single contiguous buffer
+        #    Row i's title is buffer[title_offsets[i]:title_offsets[i + 1]], and the
+        #    description follows it in [title_offsets[i + 1]:desc_offsets[i + 1]].
+        chunks = []
+        offsets = np.zeros(2 * n + 1, dtype=np.int64)
+        position = 0
+        for i, r in enumerate(rows):
+            for j, text in enumerate((r[1], r[3])):
+                encoded = (text or '').encode('utf-8')
+                chunks.append(encoded)
+                position += len(encoded)
+                offsets[2 * i + j + 1] = position
+        self.text_buffer = b''.join(chunks)
+        self.text_offsets = offsets
+        self.description_null = np.fromiter((r[3] is None for r in rows), dtype=np.bool_, count=n)
+
+        # 3. Department -> course id index arrays (ids stay sorted within each department)
+        order = np.argsort(self.dept_codes, kind='stable')
+        bounds = np.searchsorted(self.dept_codes[order], np.arange(len(self.departments) + 1))
+        self.department_course_ids = {
+            dept: self.ids[order[bounds[code]:bounds[code + 1]]]
+            for code, dept in enumerate(self.departments)
+        }
+
+        # Encoded JSON bodies keyed by department filter (None = whole catalog)
+        self._courses_json = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    # --- Lookups ---
+
+    def rows_for(self, course_ids):
+        """Maps course ids to row positions; ids not in the catalog map to -1."""
+        course_ids = np.asarray(course_ids, dtype=np.int64)
+        if len(self.ids) == 0:
+            return np.full(course_ids.shape, -1, dtype=np.int64)
+        rows = np.minimum(np.searchsorted(self.ids, course_ids), len(self.ids) - 1)
+        rows[self.ids[rows] != course_ids] = -1
+        return rows
+
+    def row_of(self, course_id):
+        row = self.rows_for([course_id])[0]
+        return None if row < 0 else int(row)
+
+    def title(self, row):
+        return self.text_buffer[self.text_offsets[2 * row]:self.text_offsets[2 * row + 1]].decode('utf-8')
+
+    def description(self, row):
+        if self.description_null[row]:
+            return None
+        return self.text_buffer[self.text_offsets[2 * row + 1]:self.text_offsets[2 * row + 2]].decode('utf-8')
+
+    def to_dict(self, row):
+        credits = int(self.credits[row])
+        return {
+            'id': int(self.ids[row]),
+            'title': self.title(row),
+            'department': self.departments[self.dept_codes[row]],
+            'description': self.description(row),
+            'credits': None if credits == MISSING_CREDITS else credits
+        }
+
+    def to_dicts(self, department=None):
+        """All courses as dicts, or only one department's (via the department index)."""
+        if department is None:
+            rows = range(len(self.ids))
+        else:
+            rows = self.rows_for(self.department_course_ids.get(department, ()))
+        return [self.to_dict(row) for row in rows]
+
+    def courses_json(self, dumps, department=None):
+        """
+        Serialized /api/courses body (optionally for one department). Only the whole
+        catalog and known departments are cached, so arbitrary filters can't grow it.
+        """
+        if department is not None and department not in self.department_course_ids:
+            return dumps([])
+        if department not in self._courses_json:
+            self._courses_json[department] = dumps(self.to_dicts(department))
+        return self._courses_json[department]
+
+    def course_details(self, recommendations):
+        """Joins ranked recommendations ('id', 'score', 'explanation') with course metadata, preserving order."""
+        results = []
+        for rec in recommendations:
+            row = self.row_of(rec['id'])
+            if row is None:
+                continue
+            course = self.to_dict(row)
+            course['score'] = rec['score']
+            course['explanation'] = rec['explanation']
+            results.append(course)
+        return results
+
+    # --- Aggregates ---
+
+    def department_totals(self, per_course_values):
+        """Sums a per-row array by department, returned as (department, total) pairs sorted by total."""
+        totals = np.bincount(self.dept_codes, weights=per_course_values, minlength=len(self.departments))
+        order = np.argsort(-totals, kind='stable')
+        return [(self.departments[code], int(totals[code])) for code in order]
+
+    # --- Diagnostics ---
+
+    def memory_usage(self):
+        """Approximate bytes held by the store, broken down by component."""
+        usage = {
+            'ids': self.ids.nbytes,
+            'credits': self.credits.nbytes,
+            'dept_codes': self.dept_codes.nbytes,
+            'departments': sum(sys.getsizeof(d) for d in self.departments) + sys.getsizeof(self.departments),
+            'text_buffer': sys.getsizeof(self.text_buffer),
+            'text_offsets': self.text_offsets.nbytes,
+            'description_null': self.description_null.nbytes,
+            'department_index': sum(a.nbytes for a in self.department_course_ids.values())
+                                + sys.getsizeof(self.department_course_ids),
+        }
+        usage['total'] = sum(usage.values())
+        return usage
@@ -0,0 +1,58 @@
+# pool_metrics.py - Connection pool utilization counters for SQLAlchemy engines
+
+import threading
+from sqlalchemy import event
+
+
+class PoolMetrics:
+    """Tracks checkouts on an engine's pool and reports current/peak utilization."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.total_checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+
+        event.listen(engine, 'connect', self._on_connect)
+        event.listen(engine, 'checkout', self._on_checkout)
+        event.listen(engine, 'checkin', self._on_checkin)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.total_checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            # checkin also fires for connections invalidated before checkout completed
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def snapshot(self):
+        pool = self.engine.pool
+        # Only QueuePool exposes size/overflow; other pool classes report None
+        size = pool.size() if hasattr(pool, 'size') else None
+        max_overflow = getattr(pool, '_max_overflow', None)
+        capacity = size + max_overflow if size is not None and max_overflow is not None and max_overflow >= 0 else None
+
+        with self._lock:
+            metrics = {
+                'url': self.engine.url.render_as_string(hide_password=True),
+                'pool_class': type(pool).__name__,
+                'pool_size': size,
+                'max_overflow': max_overflow,
+                'checked_out': self.checked_out,
+                'checked_in': pool.checkedin() if hasattr(pool, 'checkedin') else None,
+                'overflow': pool.overflow() if hasattr(pool, 'overflow') else None,
+                'peak_checked_out': self.peak_checked_out,
+                'total_checkouts': self.total_checkouts,
+                'connections_opened': self.connections_opened,
+            }
+        metrics['utilization'] = round(metrics['checked_out'] / capacity, 3) if capacity else None
+        return metrics
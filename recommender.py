@@ -0,0 +1,123 @@
+# recommender.py - In-memory recommender snapshot (enrollment matrix + course catalog)
+
+import numpy as np
+from scipy import sparse
+
+from weighting import WEIGHTING_PRESETS, enrollment_weights, idf_weights
+
+
+class RecommenderSnapshot:
+    """
+    Everything needed to answer /api/recommend without touching the database:
+    a user x course feedback matrix (CSR) whose columns are the rows of the
+    CatalogStore it was built against. Weights come from the WeightingConfig ('binary' = every enrollment is 1).
+    """
+
+    def __init__(self, enrollment_pairs, catalog, grades=None, semesters=None, weighting=None):
+        self.catalog = catalog
+        self.weighting = weighting or WEIGHTING_PRESETS['binary']
+
+        pairs = np.asarray(enrollment_pairs, dtype=np.int64).reshape(-1, 2)
+        cols = self.catalog.rows_for(pairs[:, 1])
+        # Enrollments pointing at courses missing from the catalog can't be scored
+        keep = cols >= 0
+        pairs, cols = pairs[keep], cols[keep]
+
+        # 1. Per-enrollment feedback weights (grade x recency), 1.0 everywhere for 'binary'
+        if grades is None:
+            grades = [None] * len(keep)
+        if semesters is None:
+            semesters = [None] * len(keep)
+        weights = enrollment_weights(
+            np.asarray(grades, dtype=object)[keep], np.asarray(semesters, dtype=object)[keep], self.weighting
+        )
+
+        self.user_ids, rows = np.unique(pairs[:, 0], return_inverse=True)
+
+        # Raw enrollment rows per course (duplicates included), used for trends
+        self.course_enrollment_counts = np.bincount(cols, minlength=len(self.catalog))
+
+        # 2. Duplicate (user, course) enrollments keep their strongest weight
+        if len(pairs):
+            order = np.lexsort((cols, rows))
+            rows, cols, weights = rows[order], cols[order], weights[order]
+            starts = np.flatnonzero(np.r_[True, (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])])
+            rows, cols, weights = rows[starts], cols[starts], np.maximum.reduceat(weights, starts)
+
+        self.matrix = sparse.csr_matrix(
+            (weights, (rows, cols)),
+            shape=(len(self.user_ids), len(self.catalog))
+        )
+
+        # 3. IDF down-weights ubiquitous courses when comparing students
+        course_user_counts = np.bincount(cols, minlength=len(self.catalog))
+        self.idf = idf_weights(course_user_counts, len(self.user_ids), self.weighting)
+        # Courses nobody took can't overlap with anyone; keep them out of the virtual user's norm
+        self.idf[course_user_counts == 0] = 0.0
+        self.idf_squared = self.idf ** 2
+        idf_matrix = self.matrix @ sparse.diags(self.idf)
+        self.user_norms = np.sqrt(np.asarray(idf_matrix.multiply(idf_matrix).sum(axis=1)).ravel())
+
+    def recommend(self, taken_course_ids, num_recommendations=4):
+        """
+        Returns up to num_recommendations dicts ordered by score (highest first).
+        Each course is scored by the best (similarity x feedback weight) among the
+        users who took it, and the explanation names that neighbor and the courses
+        they share with the input.
+        """
+        taken_cols = self.catalog.rows_for(list(taken_course_ids))
+        taken_cols = np.unique(taken_cols[taken_cols >= 0])
+        if taken_cols.size == 0 or self.matrix.shape[0] == 0:
+            return []
+        taken = set(taken_cols.tolist())
+
+        # 1. Cosine similarity between the virtual user and every existing user,
+        #    both scaled by course IDF (the virtual user's courses all weigh 1)
+        virtual = np.zeros(self.matrix.shape[1])
+        virtual[taken_cols] = self.idf_squared[taken_cols]
+        overlap = self.matrix @ virtual
+        virtual_norm = np.sqrt(self.idf_squared[taken_cols].sum())
+        if virtual_norm == 0:
+            return []
+        with np.errstate(divide='ignore', invalid='ignore'):
+            similarity = overlap / (self.user_norms * virtual_norm)
+        similarity = np.nan_to_num(similarity)
+        similarity[similarity <= 0] = 0.0
+
+        # 2. Score each course by its best neighbor: max over users of sim * feedback weight
+        weighted = sparse.diags(similarity) @ self.matrix
+        weighted = weighted.tocsc()
+        scores = weighted.max(axis=0).toarray().ravel()
+        best_neighbors = np.asarray(weighted.argmax(axis=0)).ravel()
+        scores[taken_cols] = 0.0
+
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size == 0:
+            return []
+
+        # 3. Rank candidates (catalog rows are in id order, so ties break on course id)
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        recommendations = []
+        for col in order[:num_recommendations]:
+            neighbor_row = best_neighbors[col]
+            neighbor_cols = self.matrix.indices[self.matrix.indptr[neighbor_row]:self.matrix.indptr[neighbor_row + 1]]
+            shared = sorted(int(self.catalog.ids[c]) for c in neighbor_cols if c in taken)
+            recommendations.append({
+                'id': int(self.catalog.ids[col]),
+                'score': float(scores[col]),
+                'explanation': {
+                    'neighbor_user_id': int(self.user_ids[neighbor_row]),
+                    'similarity': float(similarity[neighbor_row]),
+                    'shared_course_ids': shared
+                }
+            })
+        return recommendations
+
+    def department_enrollment_trends(self):
+        """(department, enrollment count) pairs, most popular first, skipping empty departments."""
+        return [
+            (dept, count)
+            for dept, count in self.catalog.department_totals(self.course_enrollment_counts)
+            if count > 0
+        ]
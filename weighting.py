@@ -0,0 +1,120 @@
+# weighting.py - Converts enrollment grades and semesters into implicit-feedback weights
+
+import logging
+import re
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# How strongly a grade signals that the student valued the course
+DEFAULT_GRADE_WEIGHTS = {
+    'A': 1.0, 'B': 0.85, 'C': 0.65, 'D': 0.4, 'F': 0.2,
+    'P': 0.85, 'S': 0.85, 'NP': 0.3, 'U': 0.3, 'W': 0.2,
+}
+
+# Academic terms in calendar order (UCSD runs quarters plus summer sessions)
+TERM_ORDER = {'WINTER': 0, 'SPRING': 1, 'SUMMER': 2, 'FALL': 3}
+# Registrar term codes ('FA22', 'SP23', ...); both summer sessions count as the summer term
+TERM_CODES = {'WI': 'WINTER', 'SP': 'SPRING', 'SU': 'SUMMER', 'S1': 'SUMMER', 'S2': 'SUMMER', 'FA': 'FALL'}
+SEMESTER_PATTERN = re.compile(r'^\s*([A-Za-z]+)\s+(\d{4})\s*$')
+TERM_CODE_PATTERN = re.compile(r'^\s*([A-Za-z][A-Za-z0-9])\s*(\d{2})\s*$')
+
+
+class WeightingConfig:
+    """
+    Settings for turning enrollments into matrix weights.
+
+    grade_weights:          grade -> weight (None disables grade weighting)
+    unknown_grade_weight:   weight for missing or unrecognized grades
+    recency_half_life:      terms after which a course counts half as much (None disables decay)
+    idf:                    down-weight courses almost everyone takes when comparing students
+    """
+
+    def __init__(self, grade_weights=DEFAULT_GRADE_WEIGHTS, unknown_grade_weight=1.0,
+                 recency_half_life=6, idf=True):
+        self.grade_weights = grade_weights
+        self.unknown_grade_weight = unknown_grade_weight
+        self.recency_half_life = recency_half_life
+        self.idf = idf
+
+
+WEIGHTING_PRESETS = {
+    # Every enrollment counts as 1 (the original recommender behavior)
+    'binary': WeightingConfig(grade_weights=None, recency_half_life=None, idf=False),
+    # Only down-weights ubiquitous courses; enrollments stay 1
+    'idf': WeightingConfig(grade_weights=None, recency_half_life=None, idf=True),
+    'weighted': WeightingConfig(),
+}
+
+
+def grade_weight(grade, config):
+    if not grade:
+        return config.unknown_grade_weight
+    grade = grade.strip().upper()
+    if grade in config.grade_weights:
+        return config.grade_weights[grade]
+    # Letter grades with +/- modifiers (e.g. 'A-', 'B+') use the base letter
+    return config.grade_weights.get(grade[:1], config.unknown_grade_weight)
+
+
+def semester_ordinal(semester):
+    """'Fall 2024' or 'FA24' -> sortable term number, or None when the string can't be parsed."""
+    semester = semester or ''
+    match = SEMESTER_PATTERN.match(semester)
+    if match:
+        term, year = match.group(1).upper(), int(match.group(2))
+    else:
+        match = TERM_CODE_PATTERN.match(semester)
+        if not match:
+            return None
+        term, year = TERM_CODES.get(match.group(1).upper()), 2000 + int(match.group(2))
+    if term not in TERM_ORDER:
+        return None
+    return year * len(TERM_ORDER) + TERM_ORDER[term]
+
+
+def _map_unique(values, func):
+    """Applies func once per distinct value and broadcasts the result back (values repeat heavily)."""
+    values = np.array(['' if v is None else str(v) for v in values], dtype=object)
+    if values.size == 0:
+        return np.empty(0, dtype=np.float64)
+    uniques, inverse = np.unique(values, return_inverse=True)
+    mapped = np.array([func(u) for u in uniques], dtype=np.float64)
+    return mapped[inverse]
+
+
+def enrollment_weights(grades, semesters, config):
+    """Per-enrollment feedback weights from grades and semester recency (vectorized)."""
+    count = len(grades)
+    weights = np.ones(count, dtype=np.float64)
+
+    if config.grade_weights is not None:
+        weights *= _map_unique(grades, lambda g: grade_weight(g, config))
+
+    if config.recency_half_life:
+        terms = _map_unique(semesters, lambda s: np.nan if semester_ordinal(s) is None else semester_ordinal(s))
+        if count and np.all(np.isnan(terms)):
+            logger.warning("Recency weighting is enabled but none of the %d semesters could be parsed; "
+                           "enrollments are not decayed.", count)
+        elif count:
+            age = np.nanmax(terms) - terms
+            decay = np.power(0.5, age / config.recency_half_life)
+            # Enrollments with an unparseable semester are not decayed
+            weights *= np.where(np.isnan(decay), 1.0, decay)
+
+    return weights
+
+
+def idf_weights(course_user_counts, num_users, config):
+    """BM25-style inverse document frequency per course (all ones when disabled)."""
+    if not config.idf:
+        return np.ones(len(course_user_counts), dtype=np.float64)
+    df = np.asarray(course_user_counts, dtype=np.float64)
+    return np.log1p((num_users - df + 0.5) / (df + 0.5))
+
+
+def weighting_from_name(name):
+    try:
+        return WEIGHTING_PRESETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown weighting '{name}'. Choose one of: {', '.join(WEIGHTING_PRESETS)}")